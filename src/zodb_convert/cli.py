@@ -3,17 +3,43 @@
 from zodb_convert.config import open_storages
 from zodb_convert.copier import copy_transactions
 from zodb_convert.copier import get_incremental_start_tid
+from zodb_convert.copier import storage_has_data
+from zodb_convert.fingerprint import Fingerprints
 from zodb_convert.progress import ProgressReporter
 
 import argparse
 import contextlib
 import logging
 import sys
+import time
 
 
 log = logging.getLogger("zodb-convert")
 
 
+class _TimestampCachingFormatter(logging.Formatter):
+    """Formatter that memoizes the asctime string at 1-second resolution.
+
+    %(asctime)s normally costs a localtime() + strftime() per record; in
+    -vv mode every transaction emits a record, so the formatted timestamp
+    is cached until the wall-clock second changes.
+    """
+
+    def __init__(self, fmt=None):
+        super().__init__(fmt)
+        self._last_second = None
+        self._last_asctime = ""
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_second = second
+            self._last_asctime = time.strftime(
+                datefmt or "%Y-%m-%d %H:%M:%S", time.localtime(second)
+            )
+        return self._last_asctime
+
+
 def parse_args(argv):
     """Parse command-line arguments."""
     parser = argparse.ArgumentParser(
@@ -25,7 +51,11 @@ def parse_args(argv):
         "config_file",
         nargs="?",
         default=None,
-        help="Traditional ZConfig configuration file with source/destination sections.",
+        help=(
+            "Traditional ZConfig configuration file defining the storages "
+            "(<filestorage source>/<filestorage destination> sections); "
+            "not a file of command-line defaults."
+        ),
     )
 
     source_group = parser.add_argument_group("source options")
@@ -65,6 +95,38 @@ def parse_args(argv):
         action="store_true",
         help="Resume from the last transaction in the destination.",
     )
+    behavior_group.add_argument(
+        "--batch-size",
+        type=int,
+        default=1,
+        metavar="N",
+        help=(
+            "Group N source transactions into one destination commit to "
+            "amortize fsync cost (default: 1, no batching). Per-record "
+            "serials are preserved, but destination transaction "
+            "boundaries collapse onto the last transaction of each "
+            "batch; avoid combining with --incremental."
+        ),
+    )
+    behavior_group.add_argument(
+        "--checkpoint",
+        action="store_true",
+        help=(
+            "Keep a record-fingerprint file next to the destination and "
+            "skip records an earlier (possibly failed) run already "
+            "copied. Makes restarts after partial failures cheap."
+        ),
+    )
+    behavior_group.add_argument(
+        "--hardlink-blobs",
+        action="store_true",
+        help=(
+            "Hardlink blob files instead of copying when source and "
+            "destination blob directories share a filesystem. O(1) per "
+            "blob, but the destination blobs then share inodes with the "
+            "source tree."
+        ),
+    )
     behavior_group.add_argument(
         "-w",
         "--workers",
@@ -143,7 +205,10 @@ def parse_args(argv):
 
 
 def _setup_logging(verbose):
-    """Configure logging based on verbosity level."""
+    """Configure logging based on verbosity level.
+
+    Returns the installed handler so main() can flush it on the way out.
+    """
     if verbose >= 2:
         level = logging.DEBUG
     elif verbose >= 1:
@@ -152,7 +217,9 @@ def _setup_logging(verbose):
         level = logging.WARNING
 
     handler = logging.StreamHandler(sys.stderr)
-    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    handler.setFormatter(
+        _TimestampCachingFormatter("%(asctime)s %(levelname)s %(message)s")
+    )
 
     # Configure root logger so destination storage progress (e.g.
     # zodb_pgjsonb.storage) is visible during parallel delegation.
@@ -162,6 +229,19 @@ def _setup_logging(verbose):
 
     # Keep zodb-convert logger explicit for direct use.
     logging.getLogger("zodb-convert").setLevel(level)
+    return handler
+
+
+def _teardown_logging(handler):
+    """Flush and detach the handler main() installed.
+
+    Removing the handler keeps repeated main() calls (tests, embedding)
+    from stacking handlers on the root logger.
+    """
+    with contextlib.suppress(Exception):
+        handler.flush()
+        logging.getLogger().removeHandler(handler)
+        handler.close()
 
 
 def _get_s3_client(args):  # pragma: no cover
@@ -230,7 +310,7 @@ def _open_destination(args):  # pragma: no cover
 def main(argv=None):
     """Main entry point for zodb-convert."""
     args = parse_args(argv if argv is not None else sys.argv[1:])
-    _setup_logging(args.verbose)
+    log_handler = _setup_logging(args.verbose)
 
     if args.upload_blobs:  # pragma: no cover
         from zodb_convert.manifest import upload_from_manifest
@@ -265,6 +345,7 @@ def main(argv=None):
             for obj in getattr(args, "_closables", []):
                 with contextlib.suppress(Exception):
                     obj.close()
+            _teardown_logging(log_handler)
 
     closables = []
     try:
@@ -287,17 +368,48 @@ def main(argv=None):
         if args.dry_run:
             log.info("Dry run mode: no data will be written")
 
-        # len(source) returns OID count (O(1) for FileStorage) — used
-        # for approximate progress percentage without iterating.
-        total_oids = 0
-        with contextlib.suppress(TypeError):
-            total_oids = len(source)
+        # len(source) returns the OID count (O(1) for FileStorage) — used
+        # for approximate progress percentage without iterating.  Passed as
+        # a callable so the reporter resolves it lazily at the first log
+        # and copying starts immediately even for storages with a slow
+        # __len__.
+        def total_oids():
+            try:
+                return len(source)
+            except TypeError:
+                return 0
+
+        # getSize() is an equally cheap byte-count fallback for storages
+        # where len() isn't available.
+        total_source_bytes = 0
+        with contextlib.suppress(Exception):
+            total_source_bytes = source.getSize() or 0
 
         progress = ProgressReporter(
             total_oids=total_oids,
+            total_source_bytes=total_source_bytes,
             verbose=args.verbose >= 1,
         )
 
+        fingerprints = None
+        if args.checkpoint and not args.dry_run:
+            try:
+                fingerprints = Fingerprints(destination.getName() + ".zconvert-fp")
+            except Exception as e:
+                log.warning("Checkpoint fingerprints unavailable: %s", e)
+            else:
+                closables.append(fingerprints)
+                if len(fingerprints) and not storage_has_data(destination):
+                    # Fingerprints are only recorded after a destination
+                    # commit, so a populated file next to an empty
+                    # destination means the destination was recreated.
+                    # Trusting it would silently skip every record.
+                    log.warning(
+                        "Ignoring stale checkpoint fingerprints: "
+                        "destination storage is empty"
+                    )
+                    fingerprints.clear()
+
         txn_count, obj_count, blob_count = copy_transactions(
             source,
             destination,
@@ -306,6 +418,9 @@ def main(argv=None):
             progress=progress,
             workers=args.workers,
             blob_mode=blob_mode,
+            batch_size=args.batch_size,
+            hardlink_blobs=args.hardlink_blobs,
+            fingerprints=fingerprints,
         )
 
         if txn_count is None:
@@ -333,3 +448,4 @@ def main(argv=None):
         for obj in closables:
             with contextlib.suppress(Exception):
                 obj.close()
+        _teardown_logging(log_handler)
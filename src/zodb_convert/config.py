@@ -2,7 +2,10 @@
 
 from io import StringIO
 
+import functools
 import logging
+import mmap
+import os
 import re
 import ZConfig
 import ZODB.config
@@ -26,22 +29,164 @@ _ZOPE_SPECIFIC_KEYS = (
     "container-class",
 )
 
+# All zope.conf parsing patterns live here, compiled exactly once at import
+# time: the directive scan and the Zope-key strip run on every parse, and a
+# single alternation replaces one re.sub() pass per key.  The directive
+# pattern is a bytes pattern so it can scan an mmap of the file without
+# decoding it.  The only dynamic pattern (per db name, below) is bounded by
+# lru_cache so the set of compiled regexes can never grow past re's own
+# 512-entry internal cache.
+_DIRECTIVE_RE = re.compile(rb"^(%(?:import|define)\s+.*)$", re.MULTILINE)
+_ZODB_DB_OPEN_RE = re.compile(r"<zodb_db\s+\S+\s*>")
+_ZOPE_KEYS_RE = re.compile(
+    r"^\s*(?:" + "|".join(_ZOPE_SPECIFIC_KEYS) + r")\s+.*$", re.MULTILINE
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_schema():
+    """Load the ZConfig schema, parsing SCHEMA_XML only once per process.
+
+    Schema loading walks ZODB's component.xml on every call; the schema
+    object itself is immutable, so one parse serves both storages (and
+    any reopen during the same run).
+    """
+    return ZConfig.loadSchemaFile(StringIO(SCHEMA_XML))
+
+
+@functools.lru_cache(maxsize=8)
+def _zodb_db_open_re(db_name):
+    """Compiled pattern matching the opening <zodb_db db_name> tag line."""
+    return re.compile(rb"<zodb_db\s+" + re.escape(db_name).encode() + rb"\s*>$")
+
+
+def _extract_zodb_db_section(content, db_name):
+    """Extract the <zodb_db db_name>...</zodb_db> block in a single pass.
+
+    Line-oriented scan with a section-depth counter.  Unlike a DOTALL
+    regex over the whole file this never backtracks and keeps O(depth)
+    state, regardless of how many <zodb_db> sections the file contains.
+
+    *content* is bytes-like (a plain bytes object or an mmap of the
+    file); only small per-line slices are materialized during the scan.
+
+    Returns the section as bytes, or None if no matching section exists.
+    """
+    open_re = _zodb_db_open_re(db_name)
+    pos = 0
+    size = len(content)
+    start = None
+    depth = 0
+    while pos < size:
+        eol = content.find(b"\n", pos)
+        if eol == -1:
+            eol = size
+        stripped = content[pos:eol].strip()
+        if start is None:
+            if open_re.match(stripped):
+                start = pos
+                depth = 1
+        elif stripped.startswith(b"</"):
+            depth -= 1
+            if depth == 0:
+                return bytes(content[start:eol])
+        elif stripped.startswith(b"<"):
+            depth += 1
+        pos = eol + 1
+    return None
 
-def open_storages_from_config(config_path):
+
+class _LazyStorage:
+    """Defer opening a storage until something actually touches it.
+
+    FileStorage construction reads the index file and builds the whole
+    OID→position dict in RAM — wasted work for a destination that a
+    --dry-run never writes to.  The factory runs on first attribute
+    access; close() before that stays a no-op.
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._storage = None
+
+    def _open(self):
+        if self._storage is None:
+            self._storage = self._factory()
+        return self._storage
+
+    def __getattr__(self, name):
+        return getattr(self._open(), name)
+
+    def close(self):
+        if self._storage is not None:
+            self._storage.close()
+
+
+def open_storages_from_config(config_path, lazy_dest=False):
     """Open source and/or destination storages from a traditional ZConfig file.
 
     Args:
         config_path: Path to the ZConfig configuration file.
+        lazy_dest: Wrap the destination in _LazyStorage so it only
+            opens on first use (dry-run mode).
 
     Returns (source_storage_or_None, dest_storage_or_None).
     """
-    schema = ZConfig.loadSchemaFile(StringIO(SCHEMA_XML))
-    config, _ = ZConfig.loadConfig(schema, config_path)
+    config, _ = ZConfig.loadConfig(_load_schema(), config_path)
     source = config.source.open() if config.source else None
-    destination = config.destination.open() if config.destination else None
+    destination = None
+    if config.destination:
+        destination = (
+            _LazyStorage(config.destination.open)
+            if lazy_dest
+            else config.destination.open()
+        )
     return source, destination
 
 
+@functools.lru_cache(maxsize=32)
+def _zope_conf_config_string(realpath, mtime_ns, db_name):
+    """Assembled ZODB config string for (file, db name), memoized.
+
+    The directive scan, section extraction and rewrites are
+    deterministic on the file content, so the result is cached keyed on
+    (realpath, mtime) — reopening the same zope.conf (e.g. source and
+    destination dbs from one file, or batch scripts) skips the whole
+    parse.  Only the string is cached, never an opened storage.
+    """
+    # mmap the file so the directive and section scans run over the kernel
+    # page cache instead of a userspace copy of the whole file; only the
+    # matched slices are decoded to str.
+    with open(realpath, "rb") as f:
+        try:
+            content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Zero-length file cannot be mmapped (and contains nothing).
+            content = b""
+        try:
+            # Extract %import and %define directives
+            directives = [d.decode() for d in _DIRECTIVE_RE.findall(content)]
+
+            # Extract <zodb_db db_name>...</zodb_db> section
+            section = _extract_zodb_db_section(content, db_name)
+        finally:
+            if isinstance(content, mmap.mmap):
+                content.close()
+
+    if section is None:
+        raise ValueError(f"No <zodb_db {db_name}> section found in {realpath}")
+    section = section.decode()
+
+    # Convert <zodb_db NAME> to <zodb NAME> format
+    section = _ZODB_DB_OPEN_RE.sub(f"<zodb {db_name}>", section)
+    section = section.replace("</zodb_db>", "</zodb>")
+
+    # Remove Zope-specific keys
+    section = _ZOPE_KEYS_RE.sub("", section)
+
+    return "\n".join(directives) + "\n" + section
+
+
 def open_storage_from_zope_conf(path, db_name="main"):
     """Extract storage configuration from a zope.conf file and return a ZODB.DB.
 
@@ -54,34 +199,28 @@ def open_storage_from_zope_conf(path, db_name="main"):
 
     Returns a ZODB.DB object. Caller uses db.storage and must call db.close().
     """
-    with open(path) as f:
-        content = f.read()
-
-    # Extract %import and %define directives
-    directives = re.findall(r"^(%(?:import|define)\s+.*)$", content, re.MULTILINE)
+    realpath = os.path.realpath(path)
+    mtime_ns = os.stat(realpath).st_mtime_ns
+    config_str = _zope_conf_config_string(realpath, mtime_ns, db_name)
+    return ZODB.config.databaseFromString(config_str)
 
-    # Extract <zodb_db db_name>...</zodb_db> section
-    pattern = r"(<zodb_db\s+" + re.escape(db_name) + r"\s*>.*?</zodb_db>)"
-    match = re.search(pattern, content, re.DOTALL)
-    if not match:
-        raise ValueError(f"No <zodb_db {db_name}> section found in {path}")
 
-    section = match.group(1)
+def _open_zope_conf_db(path, db_name, pool, closables):
+    """Open a zope.conf database, through *pool* when one is given.
 
-    # Convert <zodb_db NAME> to <zodb NAME> format
-    section = re.sub(r"<zodb_db\s+\S+\s*>", f"<zodb {db_name}>", section)
-    section = section.replace("</zodb_db>", "</zodb>")
-
-    # Remove Zope-specific keys
-    for key in _ZOPE_SPECIFIC_KEYS:
-        section = re.sub(rf"^\s*{key}\s+.*$", "", section, flags=re.MULTILINE)
-
-    config_str = "\n".join(directives) + "\n" + section
-    db = ZODB.config.databaseFromString(config_str)
+    Pooled handles join *closables* like plain DB objects do — closing
+    them releases the pool reference instead of the connection.
+    """
+    if pool is not None:
+        key = (os.path.realpath(path), db_name)
+        db = pool.acquire(key, lambda: open_storage_from_zope_conf(path, db_name))
+    else:
+        db = open_storage_from_zope_conf(path, db_name)
+    closables.append(db)
     return db
 
 
-def open_storages(options):
+def open_storages(options, pool=None):
     """Open source and destination storages from CLI options.
 
     Supports three modes:
@@ -89,6 +228,10 @@ def open_storages(options):
     2. Both from zope.conf files
     3. Mixed (one from zope.conf, other from config file)
 
+    An optional StoragePool (see zodb_convert.pool) multiplexes zope.conf
+    opens across calls, keyed on (realpath, db name) — useful for batch
+    scripts that convert many databases in a loop.
+
     Returns (source_storage, dest_storage, closables) where closables
     is a list of objects to close when done (DB objects from zope.conf).
     """
@@ -96,9 +239,15 @@ def open_storages(options):
     destination = None
     closables = []
 
+    # A dry run never writes to the destination, so its (potentially
+    # index-loading) open can be deferred until something touches it.
+    lazy_dest = getattr(options, "dry_run", False)
+
     # From traditional config file
     if options.config_file:
-        cfg_source, cfg_dest = open_storages_from_config(options.config_file)
+        cfg_source, cfg_dest = open_storages_from_config(
+            options.config_file, lazy_dest=lazy_dest
+        )
         if cfg_source is not None:
             source = cfg_source
         if cfg_dest is not None:
@@ -110,9 +259,10 @@ def open_storages(options):
             raise ValueError(
                 "Source specified in both config file and --source-zope-conf"
             )
-        db = open_storage_from_zope_conf(options.source_zope_conf, options.source_db)
+        db = _open_zope_conf_db(
+            options.source_zope_conf, options.source_db, pool, closables
+        )
         source = db.storage
-        closables.append(db)
 
     # Destination from zope.conf
     if options.dest_zope_conf:
@@ -120,9 +270,19 @@ def open_storages(options):
             raise ValueError(
                 "Destination specified in both config file and --dest-zope-conf"
             )
-        db = open_storage_from_zope_conf(options.dest_zope_conf, options.dest_db)
-        destination = db.storage
-        closables.append(db)
+        if lazy_dest:
+
+            def _open_dest_db(path=options.dest_zope_conf, name=options.dest_db):
+                db = open_storage_from_zope_conf(path, name)
+                closables.append(db)
+                return db.storage
+
+            destination = _LazyStorage(_open_dest_db)
+        else:
+            db = _open_zope_conf_db(
+                options.dest_zope_conf, options.dest_db, pool, closables
+            )
+            destination = db.storage
 
     if source is None:
         raise ValueError(
@@ -0,0 +1,52 @@
+"""Record fingerprints for cheap restart-after-failure copies."""
+
+import dbm
+import hashlib
+import logging
+
+
+log = logging.getLogger("zodb-convert")
+
+
+class Fingerprints:
+    """Persistent oid → content-hash map kept next to the destination.
+
+    Used by copy_transactions to skip re-restoring records that a
+    previous, partially failed run already wrote: a record whose
+    blake2b(data) digest matches the stored hash for its (oid, tid) is
+    assumed present at the destination.  Keying on oid *and* tid keeps
+    every revision skippable, not just the latest one per object.
+
+    This is a best-effort idempotency aid, not a correctness guarantee —
+    fingerprints are only recorded after the enclosing transaction
+    committed, so a crash can at worst cause records to be copied again.
+    """
+
+    digest_size = 16  # blake2b-128: collision-safe for dedup, 2x faster than sha256
+
+    def __init__(self, path):
+        # Held open for the object's lifetime; released via close().
+        self._db = dbm.open(path, "c")  # noqa: SIM115
+
+    def digest(self, data):
+        return hashlib.blake2b(data, digest_size=self.digest_size).digest()
+
+    def __len__(self):
+        return len(self._db)
+
+    def matches(self, oid, tid, digest):
+        try:
+            return self._db.get(oid + tid) == digest
+        except Exception:
+            return False
+
+    def update(self, oid, tid, digest):
+        self._db[oid + tid] = digest
+
+    def clear(self):
+        """Drop every recorded fingerprint (the file itself stays)."""
+        for key in list(self._db.keys()):
+            del self._db[key]
+
+    def close(self):
+        self._db.close()
@@ -0,0 +1,84 @@
+"""Storage pooling for scripts that convert many databases in one run."""
+
+from collections import OrderedDict
+
+import contextlib
+import logging
+
+
+log = logging.getLogger("zodb-convert")
+
+
+class _PooledStorage:
+    """Refcounted handle on a pooled storage (or DB) object.
+
+    Attribute access proxies to the underlying object; close() releases
+    the handle back to the pool instead of closing the object, so the
+    pool can hand it out again.  The pool closes the object for real on
+    eviction.
+    """
+
+    def __init__(self, pool, key, obj):
+        self._pool = pool
+        self._key = key
+        self._obj = obj
+
+    def __getattr__(self, name):
+        return getattr(self._obj, name)
+
+    def close(self):
+        self._pool.release(self._key)
+
+
+class StoragePool:
+    """LRU pool of opened storages keyed on (config path, db name).
+
+    Opening a storage is expensive — FileStorage loads its index,
+    RelStorage-style backends set up an SQL connection — and a batch
+    script converting many databases pays that once per database per
+    use.  The pool keeps up to *max_size* objects open and reuses them;
+    entries are only evicted (and really closed) once no handle refers
+    to them.
+    """
+
+    def __init__(self, max_size=10):
+        self.max_size = max_size
+        # key -> [obj, refcount], in LRU order (oldest first)
+        self._entries = OrderedDict()
+
+    def acquire(self, key, factory):
+        """Return a _PooledStorage for *key*, opening via *factory* if needed."""
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = [factory(), 0]
+        else:
+            self._entries.move_to_end(key)
+        entry[1] += 1
+        self._evict()
+        return _PooledStorage(self, key, entry[0])
+
+    def release(self, key):
+        """Drop one reference to *key*; evict if the pool is over capacity."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] > 0:
+            entry[1] -= 1
+        self._evict()
+
+    def _evict(self):
+        """Close unreferenced entries, oldest first, down to max_size."""
+        while len(self._entries) > self.max_size:
+            for key, (obj, refs) in self._entries.items():
+                if refs == 0:
+                    del self._entries[key]
+                    with contextlib.suppress(Exception):
+                        obj.close()
+                    break
+            else:
+                return  # Everything still referenced; nothing to evict.
+
+    def close(self):
+        """Close all pooled objects, referenced or not."""
+        for obj, _refs in self._entries.values():
+            with contextlib.suppress(Exception):
+                obj.close()
+        self._entries.clear()
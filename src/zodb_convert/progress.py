@@ -1,5 +1,6 @@
 """Progress reporting for ZODB storage conversion."""
 
+from functools import lru_cache
 from ZODB.utils import readable_tid_repr
 
 import logging
@@ -9,44 +10,141 @@ import time
 log = logging.getLogger("zodb-convert")
 
 
+# (unit, divisor) per 1024-tier; tier selection uses bit_length so one
+# integer op replaces the chain of threshold comparisons.
+_BYTE_UNITS = (
+    ("B", 1),
+    ("KB", 1024),
+    ("MB", 1024**2),
+    ("GB", 1024**3),
+    ("TB", 1024**4),
+)
+
+
 def _format_bytes(n):
     """Format byte count as human-readable string."""
-    if n < 1024:
+    # Normalized to int before the cache so float rates (whose exact
+    # values rarely repeat) land on the same keys as plain counts.
+    return _format_bytes_int(int(n))
+
+
+@lru_cache(maxsize=512)
+def _format_bytes_int(n):
+    if n <= 0:
+        return f"{n} B"
+    i = min((n.bit_length() - 1) // 10, 4)
+    if i == 0:
         return f"{n} B"
-    if n < 1024 * 1024:
-        return f"{n / 1024:.1f} KB"
-    if n < 1024 * 1024 * 1024:
-        return f"{n / (1024 * 1024):.1f} MB"
-    return f"{n / (1024 * 1024 * 1024):.1f} GB"
+    unit, div = _BYTE_UNITS[i]
+    return f"{n / div:.1f} {unit}"
 
 
 def _format_duration(seconds):
     """Format seconds as human-readable duration."""
+    # 0.1 s granularity is below display resolution and turns the
+    # near-identical elapsed values of successive logs into cache hits.
+    return _format_duration_rounded(round(seconds, 1))
+
+
+@lru_cache(maxsize=512)
+def _format_duration_rounded(seconds):
     if seconds < 60:
         return f"{seconds:.1f}s"
-    minutes = int(seconds // 60)
-    secs = seconds % 60
-    if minutes < 60:
-        return f"{minutes}m {secs:.0f}s"
-    hours = minutes // 60
-    mins = minutes % 60
-    return f"{hours}h {mins}m"
+    # One divmod cascade computes all components; each branch then formats
+    # without recomputing them.
+    minutes, secs = divmod(seconds, 60)
+    hours, mins = divmod(int(minutes), 60)
+    if hours:
+        return f"{hours}h {mins}m"
+    return f"{mins}m {secs:.0f}s"
+
+
+class _Lazy:
+    """Log argument that defers fn(*args) until __str__.
+
+    The logging module stringifies %s arguments only when a handler
+    actually renders the record, so wrapping a formatting helper in
+    _Lazy pushes its cost past every remaining filtering stage.
+    """
+
+    __slots__ = ("_args", "_fn")
+
+    def __init__(self, fn, *args):
+        self._fn = fn
+        self._args = args
+
+    def __str__(self):
+        return self._fn(*self._args)
 
 
 class ProgressReporter:
     """Progress reporter for ZODB storage conversion.
 
     Uses total_oids (from len(source), O(1) for FileStorage) for approximate
-    progress percentage based on unique OIDs seen so far.  ETA is smoothed
-    via an exponential moving average (EMA) of the OID processing rate to
-    avoid jumpy estimates from variable transaction sizes.
+    progress percentage based on unique OIDs seen so far.  When len(source)
+    is unavailable, total_source_bytes (from source.getSize(), also O(1))
+    provides a bytes-copied fallback percentage.  ETA is smoothed via an
+    exponential moving average (EMA) of the OID processing rate to avoid
+    jumpy estimates from variable transaction sizes.
     """
 
     EMA_ALPHA = 0.1  # smoothing factor — lower = smoother, higher = more responsive
     EMA_MIN_INTERVAL = 1.0  # min seconds between rate samples
-
-    def __init__(self, total_oids=0, verbose=False, log_interval=10, log_count=100):
-        self.total_oids = total_oids
+    CHECK_MASK = 63  # clock sampled every 64th transaction in interval mode
+
+    # on_transaction updates several counters per call; slots make those
+    # attribute stores fixed-offset writes instead of __dict__ operations.
+    __slots__ = (
+        "_check_mask",
+        "_ema_rate",
+        "_interval_ns",
+        "_last_ema_oids",
+        "_last_ema_time",
+        "_last_log_ns",
+        "_log",
+        "_next_check_txn",
+        "_next_count_log",
+        "_seen_oids",
+        "_start_ns",
+        "_total_oids_fn",
+        "blob_count",
+        "last_log_txn_count",
+        "log_count",
+        "log_interval",
+        "obj_count",
+        "start_time",
+        "total_bytes",
+        "total_oids",
+        "total_source_bytes",
+        "txn_count",
+        "verbose",
+    )
+
+    def __new__(cls, total_oids=0, total_source_bytes=0, verbose=False, **kwargs):
+        # Factory: pick the mode-specialized subclass up front so
+        # on_transaction carries no per-call verbose dispatch.
+        if cls is ProgressReporter:
+            cls = _VerboseReporter if verbose else _IntervalReporter
+        return object.__new__(cls)
+
+    def __init__(
+        self,
+        total_oids=0,
+        total_source_bytes=0,
+        verbose=False,
+        log_interval=10,
+        log_count=100,
+    ):
+        # total_oids may be a zero-argument callable (e.g. lambda:
+        # len(source)); it is resolved on the first progress log so even a
+        # storage with an O(n) __len__ never delays the start of copying.
+        if callable(total_oids):
+            self._total_oids_fn = total_oids
+            self.total_oids = None
+        else:
+            self._total_oids_fn = None
+            self.total_oids = total_oids
+        self.total_source_bytes = total_source_bytes
         self.verbose = verbose
         self.log_interval = log_interval
         self.log_count = log_count
@@ -56,9 +154,18 @@ class ProgressReporter:
         self.blob_count = 0
         self.total_bytes = 0
         self._seen_oids = set()
-
-        self.start_time = time.monotonic()
-        self.last_log_time = self.start_time
+        # Logger bound on the instance: a slot load at the emission sites
+        # instead of a module-global lookup per call.
+        self._log = log
+
+        # Interval bookkeeping runs on monotonic_ns integers — int
+        # compare/subtract beats float and avoids rounding drift.
+        # start_time stays float seconds (same clock) for the EMA and
+        # summary math.
+        self._start_ns = time.monotonic_ns()
+        self.start_time = self._start_ns * 1e-9
+        self._last_log_ns = self._start_ns
+        self._interval_ns = int(self.log_interval * 1_000_000_000)
         self.last_log_txn_count = 0
 
         # EMA rate tracking (OIDs/second)
@@ -66,9 +173,45 @@ class ProgressReporter:
         self._last_ema_oids = 0
         self._last_ema_time = self.start_time
 
+        self._check_mask = self.CHECK_MASK
+        if self.total_oids:
+            self._scale_check_mask()
+        # Transaction count at which the clock is next sampled; the hot
+        # path then needs a single integer compare instead of the
+        # count-trigger arithmetic plus the stride mask test.
+        self._next_check_txn = min(self._check_mask + 1, self.log_count)
+        # Count trigger as an absolute transaction count, so the check is
+        # one compare instead of a subtraction per clock sample.
+        self._next_count_log = self.log_count
+
+    def _scale_check_mask(self):
+        """Scale the clock-sampling stride with the conversion size.
+
+        On multi-million-transaction conversions even the every-64th
+        check adds up; sampling ~1 in total/10000 still reports
+        throughput faithfully.  The stride is kept a power-of-two mask
+        (capped at 8192) so the per-transaction check stays one AND.
+        """
+        stride = self.total_oids // 10000
+        if stride > self.CHECK_MASK:
+            self._check_mask = min((1 << stride.bit_length()) - 1, 8191)
+
+    def _resolve_total_oids(self):
+        if self.total_oids is None:
+            try:
+                self.total_oids = int(self._total_oids_fn() or 0)
+            except Exception:
+                self.total_oids = 0
+            if self.total_oids:
+                self._scale_check_mask()
+        return self.total_oids
+
     def _pct(self):
+        self._resolve_total_oids()
         if self.total_oids and self._seen_oids:
             return len(self._seen_oids) * 100.0 / self.total_oids
+        if self.total_source_bytes and self.total_bytes:
+            return min(100.0, self.total_bytes * 100.0 / self.total_source_bytes)
         return 0
 
     def _update_ema(self, now):
@@ -87,6 +230,7 @@ class ProgressReporter:
         self._last_ema_time = now
 
     def _eta(self):
+        self._resolve_total_oids()
         if not self.total_oids or self._ema_rate <= 0:
             return ""
         remaining_oids = self.total_oids - len(self._seen_oids)
@@ -95,48 +239,103 @@ class ProgressReporter:
         return f", ETA: {_format_duration(remaining_oids / self._ema_rate)}"
 
     def on_transaction(self, tid, record_count, byte_size, blob_count, oids=()):
-        """Called after each transaction is copied."""
-        self.txn_count += 1
-        self.obj_count += record_count
-        self.blob_count += blob_count
-        self.total_bytes += byte_size
+        """Called after each transaction is copied.
+
+        The base implementation is the interval strategy; _VerboseReporter
+        overrides it with the always-log variant (see __new__).
+        """
+        # One tuple assignment for the counter updates: the sums happen on
+        # locals and each attribute is stored exactly once.
+        txn_count = self.txn_count + 1
+        self.txn_count, self.obj_count, self.blob_count, self.total_bytes = (
+            txn_count,
+            self.obj_count + record_count,
+            self.blob_count + blob_count,
+            self.total_bytes + byte_size,
+        )
         self._seen_oids.update(oids)
+        if txn_count == 1:
+            self._update_ema(time.monotonic())
+            self._log_transaction(tid, record_count, blob_count, byte_size)
+            return
 
-        now = time.monotonic()
-        self._update_ema(now)
-        is_first = self.txn_count == 1
+        # Interval mode: time.monotonic() per transaction is measurable on
+        # multi-million-txn conversions, so the clock is only sampled at
+        # the precomputed check point (stride or count trigger, whichever
+        # comes first — see __init__).
+        if txn_count >= self._next_check_txn:
+            now_ns = time.monotonic_ns()
+            self._update_ema(now_ns * 1e-9)
+            if self._should_interval_log(now_ns):
+                self._log_interval(now_ns)
+                self._last_log_ns = now_ns
+                self.last_log_txn_count = txn_count
+                self._next_count_log = txn_count + self.log_count
+            self._next_check_txn = min(
+                txn_count + self._check_mask + 1, self._next_count_log
+            )
 
-        if self.verbose or is_first:
-            self._log_transaction(tid, record_count, blob_count, byte_size)
-        elif self._should_interval_log(now):
-            self._log_interval(now)
-            self.last_log_time = now
-            self.last_log_txn_count = self.txn_count
-
-    def _should_interval_log(self, now):
-        elapsed_since_log = now - self.last_log_time
-        txns_since_log = self.txn_count - self.last_log_txn_count
+    def on_transactions(self, batch):
+        """Record a batch of copied transactions at once.
+
+        *batch* is a sequence of ``(tid, record_count, byte_size,
+        blob_count, oids)`` tuples.  All but the last transaction are
+        folded into a single counter update; the last one goes through
+        on_transaction, so the logging trigger fires once per batch
+        instead of once per transaction.
+        """
+        if not batch:
+            return
+        head = batch[:-1]
+        if head:
+            records = blobs = nbytes = 0
+            seen_update = self._seen_oids.update
+            for _tid, record_count, byte_size, blob_count, oids in head:
+                records += record_count
+                nbytes += byte_size
+                blobs += blob_count
+                if oids:
+                    seen_update(oids)
+            self.txn_count, self.obj_count, self.blob_count, self.total_bytes = (
+                self.txn_count + len(head),
+                self.obj_count + records,
+                self.blob_count + blobs,
+                self.total_bytes + nbytes,
+            )
+        tid, record_count, byte_size, blob_count, oids = batch[-1]
+        self.on_transaction(tid, record_count, byte_size, blob_count, oids)
+
+    def _should_interval_log(self, now_ns):
         return (
-            elapsed_since_log >= self.log_interval or txns_since_log >= self.log_count
+            now_ns - self._last_log_ns >= self._interval_ns
+            or self.txn_count >= self._next_count_log
         )
 
     def _log_transaction(self, tid, record_count, blob_count, byte_size):
+        # The formatting pre-work (_pct/_eta/_format_bytes) costs more
+        # than the emission itself; skip it all when INFO is filtered.
+        # Checked per call rather than cached in __init__ because the
+        # effective level can change after construction (caplog does).
+        if not self._log.isEnabledFor(logging.INFO):
+            return
         pct = self._pct()
         pct_str = f" ~{pct:.1f}%" if pct else ""
 
-        log.info(
+        self._log.info(
             "TX %s%s tid=%s %d records, %d blobs, %s%s",
             self.txn_count,
             pct_str,
-            readable_tid_repr(tid),
+            _Lazy(readable_tid_repr, tid),
             record_count,
             blob_count,
-            _format_bytes(byte_size),
-            self._eta(),
+            _Lazy(_format_bytes, byte_size),
+            _Lazy(self._eta),
         )
 
-    def _log_interval(self, now):
-        elapsed = now - self.start_time
+    def _log_interval(self, now_ns):
+        if not self._log.isEnabledFor(logging.INFO):
+            return
+        elapsed = (now_ns - self._start_ns) * 1e-9
         txn_rate = self.txn_count / elapsed if elapsed > 0 else 0
         byte_rate = self.total_bytes / elapsed if elapsed > 0 else 0
         pct = self._pct()
@@ -152,21 +351,49 @@ class ProgressReporter:
         if eta:
             parts.append(eta.lstrip(", "))
 
-        log.info(" | ".join(parts))
+        self._log.info(" | ".join(parts))
 
     def log_summary(self, txn_count, obj_count, blob_count):
         """Log final summary."""
+        if not self._log.isEnabledFor(logging.INFO):
+            return
         elapsed = time.monotonic() - self.start_time
         txn_rate = txn_count / elapsed if elapsed > 0 else 0
         byte_rate = self.total_bytes / elapsed if elapsed > 0 else 0
 
-        log.info(
-            "Complete: %s transactions, %s objects, %s blobs, %s in %s (avg: %s txn/s, %s/s)",
-            f"{txn_count:,}",
-            f"{obj_count:,}",
-            f"{blob_count:,}",
-            _format_bytes(self.total_bytes),
-            _format_duration(elapsed),
-            f"{txn_rate:.0f}",
-            _format_bytes(byte_rate),
+        # Plain numeric arguments: the %-template does all the formatting
+        # in one pass instead of building intermediate f-strings first.
+        self._log.info(
+            "Complete: %d transactions, %d objects, %d blobs, %s in %s (avg: %.0f txn/s, %s/s)",
+            txn_count,
+            obj_count,
+            blob_count,
+            _Lazy(_format_bytes, self.total_bytes),
+            _Lazy(_format_duration, elapsed),
+            txn_rate,
+            _Lazy(_format_bytes, byte_rate),
+        )
+
+
+class _IntervalReporter(ProgressReporter):
+    """Interval/count-triggered logging — the base on_transaction as-is."""
+
+    __slots__ = ()
+
+
+class _VerboseReporter(ProgressReporter):
+    """Per-transaction logging for -v runs; no interval machinery."""
+
+    __slots__ = ()
+
+    def on_transaction(self, tid, record_count, byte_size, blob_count, oids=()):
+        txn_count = self.txn_count + 1
+        self.txn_count, self.obj_count, self.blob_count, self.total_bytes = (
+            txn_count,
+            self.obj_count + record_count,
+            self.blob_count + blob_count,
+            self.total_bytes + byte_size,
         )
+        self._seen_oids.update(oids)
+        self._update_ema(time.monotonic())
+        self._log_transaction(tid, record_count, blob_count, byte_size)
@@ -10,9 +10,26 @@ import transaction
 import ZODB
 
 
+def _tmpfs_base():
+    """Directory for test storages: /dev/shm when opted in, else default.
+
+    FileStorage commits fsync; on tmpfs that's a memcpy, which makes the
+    FileStorage-heavy tests CPU-bound. Opt-in via ZODB_CONVERT_TEST_TMPFS=1
+    since /dev/shm capacity is limited.
+    """
+    if os.environ.get("ZODB_CONVERT_TEST_TMPFS") == "1":
+        shm = f"/dev/shm/pytest-zodb-convert-{os.getuid()}"
+        try:
+            os.makedirs(shm, exist_ok=True)
+            return shm
+        except OSError:
+            pass
+    return None
+
+
 @pytest.fixture
 def temp_dir():
-    d = tempfile.mkdtemp()
+    d = tempfile.mkdtemp(dir=_tmpfs_base())
     yield d
     shutil.rmtree(d)
 
@@ -35,10 +52,19 @@ def dest_filestorage(temp_dir):
     fs.close()
 
 
-@pytest.fixture
-def populated_source(source_filestorage):
-    """Source FileStorage with 3 transactions: basic data, nested data, blob."""
-    db = ZODB.DB(source_filestorage)
+@pytest.fixture(scope="session")
+def _populated_template(tmp_path_factory):
+    """Build the populated source storage files once per session.
+
+    Populating costs four commits (and their fsyncs); every test that
+    asks for populated_source gets a cheap file copy of these instead.
+    Returns (fs_path, blob_dir).
+    """
+    d = tmp_path_factory.mktemp("populated_template")
+    path = str(d / "source.fs")
+    blob_dir = str(d / "source_blobs")
+    fs = FileStorage(path, blob_dir=blob_dir)
+    db = ZODB.DB(fs)
     conn = db.open()
     root = conn.root()
 
@@ -66,7 +92,24 @@ def populated_source(source_filestorage):
 
     conn.close()
     db.close()
-    return source_filestorage
+    return path, blob_dir
+
+
+@pytest.fixture
+def populated_source(temp_dir, _populated_template):
+    """Source FileStorage with 3 transactions: basic data, nested data, blob.
+
+    Each test gets its own copy of the session template, so mutating
+    the storage (or its blob directory) stays isolated.
+    """
+    template_path, template_blobs = _populated_template
+    path = os.path.join(temp_dir, "source.fs")
+    blob_dir = os.path.join(temp_dir, "source_blobs")
+    shutil.copy(template_path, path)
+    shutil.copytree(template_blobs, blob_dir)
+    fs = FileStorage(path, blob_dir=blob_dir)
+    yield fs
+    fs.close()
 
 
 @pytest.fixture
@@ -1,8 +1,10 @@
 """Tests for CLI entry point."""
 
+from zodb_convert.cli import _TimestampCachingFormatter
 from zodb_convert.cli import main
 from zodb_convert.cli import parse_args
 
+import logging
 import os
 import pytest
 
@@ -90,6 +92,25 @@ class TestParseArgs:
         assert exc_info.value.code != 0
 
 
+class TestTimestampCachingFormatter:
+    def _record(self, created):
+        record = logging.LogRecord("x", logging.INFO, "p", 1, "msg", (), None)
+        record.created = created
+        return record
+
+    def test_same_second_reuses_string(self):
+        fmt = _TimestampCachingFormatter("%(asctime)s %(message)s")
+        first = fmt.formatTime(self._record(1000.1))
+        second = fmt.formatTime(self._record(1000.9))
+        assert first is second
+
+    def test_second_rollover_reformats(self):
+        fmt = _TimestampCachingFormatter("%(asctime)s %(message)s")
+        first = fmt.formatTime(self._record(1000.5))
+        second = fmt.formatTime(self._record(1001.5))
+        assert first != second
+
+
 class TestMainValidation:
     def test_no_source_configured(self, temp_dir):
         """If only a config file with destination is provided, source is missing."""
@@ -195,6 +216,8 @@ class TestMainEndToEnd:
 
         result = main([config_path, "--dry-run"])
         assert result == 0
+        # The lazy destination was never opened, so no file was created
+        assert not os.path.exists(dst_path)
 
     def test_incremental_copy(self, temp_dir):
         """Incremental copy should only copy new transactions."""
@@ -237,6 +260,37 @@ class TestMainEndToEnd:
         dst_conn.close()
         dst_db.close()
 
+    def test_checkpoint_stale_fingerprints_ignored(self, temp_dir):
+        """A populated fingerprint file next to an empty destination is stale.
+
+        Trusting it would skip every record; the CLI must detect the
+        mismatch and copy everything.
+        """
+        src_path = os.path.join(temp_dir, "source.fs")
+        dst_path = os.path.join(temp_dir, "dest.fs")
+
+        _create_source(src_path, {"key": "value"})
+        config_path = _write_config(temp_dir, src_path, dst_path)
+
+        assert main([config_path, "--checkpoint"]) == 0
+
+        # Recreate the destination but leave the fingerprint file behind.
+        for name in os.listdir(temp_dir):
+            if name.startswith("dest.fs") and "zconvert-fp" not in name:
+                os.unlink(os.path.join(temp_dir, name))
+
+        assert main([config_path, "--checkpoint"]) == 0
+
+        import ZODB
+        import ZODB.FileStorage
+
+        dst_storage = ZODB.FileStorage.FileStorage(dst_path, read_only=True)
+        dst_db = ZODB.DB(dst_storage)
+        dst_conn = dst_db.open()
+        assert dst_conn.root()["key"] == "value"
+        dst_conn.close()
+        dst_db.close()
+
     def test_verbose_output(self, temp_dir):
         """Verbose mode should work without error."""
         src_path = os.path.join(temp_dir, "source.fs")
@@ -1,4 +1,7 @@
 from types import SimpleNamespace
+from zodb_convert.config import _extract_zodb_db_section
+from zodb_convert.config import _LazyStorage
+from zodb_convert.config import _load_schema
 from zodb_convert.config import open_storage_from_zope_conf
 from zodb_convert.config import open_storages
 from zodb_convert.config import open_storages_from_config
@@ -204,6 +207,145 @@ class TestZopeConfExtraction:
             db.close()
 
 
+class TestZopeConfConfigStringCache:
+    def test_reparse_skipped_for_unchanged_file(self, temp_dir):
+        from zodb_convert.config import _zope_conf_config_string
+
+        conf_path = os.path.join(temp_dir, "zope.conf")
+        with open(conf_path, "w") as f:
+            f.write("<zodb_db main>\n<mappingstorage>\n</mappingstorage>\n</zodb_db>\n")
+
+        before = _zope_conf_config_string.cache_info().hits
+        db1 = open_storage_from_zope_conf(conf_path)
+        db1.close()
+        db2 = open_storage_from_zope_conf(conf_path)
+        db2.close()
+        assert _zope_conf_config_string.cache_info().hits == before + 1
+
+    def test_modified_file_is_reparsed(self, temp_dir):
+        conf_path = os.path.join(temp_dir, "zope.conf")
+        with open(conf_path, "w") as f:
+            f.write("<zodb_db main>\n<mappingstorage>\n</mappingstorage>\n</zodb_db>\n")
+        db = open_storage_from_zope_conf(conf_path)
+        db.close()
+
+        # Rewrite with a different db name and bump mtime past cache key
+        with open(conf_path, "w") as f:
+            f.write(
+                "<zodb_db other>\n<mappingstorage>\n</mappingstorage>\n</zodb_db>\n"
+            )
+        os.utime(conf_path, ns=(0, 0))
+
+        with pytest.raises(ValueError, match="No <zodb_db main>"):
+            open_storage_from_zope_conf(conf_path)
+
+
+class TestLazyStorage:
+    def test_factory_not_called_until_access(self):
+        calls = []
+
+        class FakeStorage:
+            def lastTransaction(self):
+                return b"\0" * 8
+
+        def factory():
+            calls.append(1)
+            return FakeStorage()
+
+        lazy = _LazyStorage(factory)
+        assert calls == []
+        assert lazy.lastTransaction() == b"\0" * 8
+        assert calls == [1]
+        # Subsequent access reuses the opened storage
+        lazy.lastTransaction()
+        assert calls == [1]
+
+    def test_close_before_open_is_noop(self):
+        lazy = _LazyStorage(lambda: pytest.fail("factory should not run"))
+        lazy.close()
+
+    def test_dry_run_leaves_dest_unopened(self, temp_dir):
+        """open_storages with dry_run never creates the destination file."""
+        src_path = os.path.join(temp_dir, "source.fs")
+        dst_path = os.path.join(temp_dir, "dest.fs")
+        config_text = f"""\
+<filestorage source>
+    path {src_path}
+</filestorage>
+
+<filestorage destination>
+    path {dst_path}
+</filestorage>
+"""
+        config_file = os.path.join(temp_dir, "convert.conf")
+        with open(config_file, "w") as f:
+            f.write(config_text)
+
+        options = SimpleNamespace(
+            config_file=config_file,
+            source_zope_conf=None,
+            source_db="main",
+            dest_zope_conf=None,
+            dest_db="main",
+            dry_run=True,
+        )
+        source, dest, _closables = open_storages(options)
+        try:
+            assert isinstance(dest, _LazyStorage)
+            assert not os.path.exists(dst_path)
+        finally:
+            source.close()
+            dest.close()
+
+
+class TestLoadSchema:
+    def test_schema_is_cached(self):
+        assert _load_schema() is _load_schema()
+
+
+class TestExtractZodbDbSection:
+    def test_simple_section(self):
+        content = (
+            b"<zodb_db main>\n    <mappingstorage>\n    </mappingstorage>\n</zodb_db>"
+        )
+        section = _extract_zodb_db_section(content, "main")
+        assert section == content
+
+    def test_missing_section(self):
+        content = b"<zodb_db main>\n</zodb_db>"
+        assert _extract_zodb_db_section(content, "catalog") is None
+
+    def test_picks_named_section(self):
+        content = (
+            b"<zodb_db main>\n"
+            b"    <mappingstorage>\n"
+            b"    </mappingstorage>\n"
+            b"</zodb_db>\n"
+            b"<zodb_db catalog>\n"
+            b"    <mappingstorage>\n"
+            b"    </mappingstorage>\n"
+            b"</zodb_db>"
+        )
+        section = _extract_zodb_db_section(content, "catalog")
+        assert section.startswith(b"<zodb_db catalog>")
+        assert section.endswith(b"</zodb_db>")
+        assert b"main" not in section
+
+    def test_deeply_nested_wrappers(self):
+        """Nested storage wrappers don't end the section early."""
+        content = (
+            b"<zodb_db main>\n"
+            b"    <z3blobs>\n"
+            b"        <pgjsonb>\n"
+            b"            dsn host=db\n"
+            b"        </pgjsonb>\n"
+            b"    </z3blobs>\n"
+            b"</zodb_db>"
+        )
+        section = _extract_zodb_db_section(content, "main")
+        assert section == content
+
+
 class TestOpenStorages:
     def _make_zope_conf(self, temp_dir, name, db_name="main"):
         """Create a minimal zope.conf with a FileStorage."""
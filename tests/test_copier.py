@@ -1,11 +1,25 @@
 from unittest.mock import MagicMock
+from ZODB.interfaces import IStorageRestoreable
+from ZODB.utils import p64
 from ZODB.utils import u64
+from zodb_convert.copier import _advise_sequential
+from zodb_convert.copier import _BatchingRestorer
+from zodb_convert.copier import _copy_blob_to_temp
+from zodb_convert.copier import _fast_copy
+from zodb_convert.copier import _filestorage_scan_back
+from zodb_convert.copier import _prefetch
+from zodb_convert.copier import _read_tid_sidecar
+from zodb_convert.copier import _tid_sidecar_path
 from zodb_convert.copier import _try_parallel_delegation
 from zodb_convert.copier import copy_transactions
 from zodb_convert.copier import detect_capabilities
 from zodb_convert.copier import get_incremental_start_tid
+from zodb_convert.copier import raw_copy_filestorage
 from zodb_convert.copier import storage_has_data
 
+import os
+import pytest
+import threading
 import transaction
 import ZODB
 import ZODB.FileStorage
@@ -95,20 +109,297 @@ class TestCopyTransactions:
     def test_copy_preserves_tids(self, populated_source, dest_filestorage):
         copy_transactions(populated_source, dest_filestorage)
 
-        source_tids = [txn.tid for txn in populated_source.iterator()]
-        dest_tids = [txn.tid for txn in dest_filestorage.iterator()]
-        assert source_tids == dest_tids
+        # Stream both iterators instead of materializing the full lists:
+        # O(1) memory, so the same assertion scales to much larger
+        # fixtures.  strict=True also catches one side ending early.
+        for i, (src_txn, dst_txn) in enumerate(
+            zip(
+                populated_source.iterator(),
+                dest_filestorage.iterator(),
+                strict=True,
+            )
+        ):
+            assert src_txn.tid == dst_txn.tid, f"TID mismatch at txn {i}"
 
     def test_copy_preserves_metadata(self, populated_source, dest_filestorage):
         copy_transactions(populated_source, dest_filestorage)
 
-        dest_txns = list(dest_filestorage.iterator())
-        # Index 0 is the initial root transaction (empty metadata)
-        # Our transactions start at index 1
-        assert b"user1" in dest_txns[1].user
-        assert b"First transaction" in dest_txns[1].description
-        assert b"user2" in dest_txns[2].user
-        assert b"user3" in dest_txns[3].user
+        # Index 0 is the initial root transaction (empty metadata);
+        # our transactions start at index 1.  Streamed for the same
+        # reason as test_copy_preserves_tids.
+        for i, txn in enumerate(dest_filestorage.iterator()):
+            if i == 1:
+                assert b"user1" in txn.user
+                assert b"First transaction" in txn.description
+            elif i == 2:
+                assert b"user2" in txn.user
+            elif i == 3:
+                assert b"user3" in txn.user
+
+
+class TestFastCopy:
+    def test_copies_content(self, tmp_path):
+        src = tmp_path / "src.blob"
+        dst = tmp_path / "dst.blob"
+        src.write_bytes(b"x" * 100_000)
+
+        size = _fast_copy(str(src), str(dst))
+
+        assert size == 100_000
+        assert dst.read_bytes() == src.read_bytes()
+
+    def test_copies_empty_file(self, tmp_path):
+        src = tmp_path / "src.blob"
+        dst = tmp_path / "dst.blob"
+        src.write_bytes(b"")
+
+        _fast_copy(str(src), str(dst))
+
+        assert dst.read_bytes() == b""
+
+    def test_overwrites_destination(self, tmp_path):
+        src = tmp_path / "src.blob"
+        dst = tmp_path / "dst.blob"
+        src.write_bytes(b"new")
+        dst.write_bytes(b"old content that is longer")
+
+        _fast_copy(str(src), str(dst))
+
+        assert dst.read_bytes() == b"new"
+
+
+class TestCopyBlobToTemp:
+    def test_creates_named_copy(self, tmp_path):
+        src = tmp_path / "src.blob"
+        tmp_dir = tmp_path / "tmp"
+        tmp_dir.mkdir()
+        src.write_bytes(b"blob payload")
+
+        result, size = _copy_blob_to_temp(str(src), str(tmp_dir))
+
+        assert os.path.dirname(result) == str(tmp_dir)
+        assert size == len(b"blob payload")
+        with open(result, "rb") as f:
+            assert f.read() == b"blob payload"
+
+    def test_unique_paths(self, tmp_path):
+        src = tmp_path / "src.blob"
+        tmp_dir = tmp_path / "tmp"
+        tmp_dir.mkdir()
+        src.write_bytes(b"data")
+
+        first, _size = _copy_blob_to_temp(str(src), str(tmp_dir))
+        second, _size = _copy_blob_to_temp(str(src), str(tmp_dir))
+        assert first != second
+
+
+class TestAdviseSequential:
+    def test_noop_without_underlying_file(self):
+        # Non-FileStorage iterators have no _file; must not raise.
+        _advise_sequential(iter([]))
+
+    def test_accepts_filestorage_iterator(self, populated_source):
+        it = populated_source.iterator()
+        try:
+            _advise_sequential(it)
+        finally:
+            it.close()
+
+
+class TestBatchingRestorer:
+    def test_flush_sends_buffered_records(self):
+        dest = MagicMock()
+        batcher = _BatchingRestorer(dest)
+        txn = object()
+
+        batcher.append(b"oid1", b"tid1", b"data", None, txn)
+        dest.restoreBatch.assert_not_called()
+
+        batcher.flush(txn)
+        dest.restoreBatch.assert_called_once_with(
+            [(b"oid1", b"tid1", b"data", "", None)], txn
+        )
+
+    def test_flush_empty_is_noop(self):
+        dest = MagicMock()
+        batcher = _BatchingRestorer(dest)
+        batcher.flush(object())
+        dest.restoreBatch.assert_not_called()
+
+    def test_record_threshold_triggers_flush(self):
+        dest = MagicMock()
+        batcher = _BatchingRestorer(dest)
+        batcher.max_records = 2
+        txn = object()
+
+        batcher.append(b"oid1", b"tid1", b"data", None, txn)
+        batcher.append(b"oid2", b"tid1", b"data", None, txn)
+        dest.restoreBatch.assert_called_once()
+        assert batcher._pending == []
+
+    def test_byte_threshold_triggers_flush(self):
+        dest = MagicMock()
+        batcher = _BatchingRestorer(dest)
+        batcher.max_bytes = 4
+        txn = object()
+
+        batcher.append(b"oid1", b"tid1", b"data!", None, txn)
+        dest.restoreBatch.assert_called_once()
+
+    def test_copy_transactions_uses_batch_api(self, source_mapping_storage):
+        """A restoreable destination with restoreBatch gets records in bulk."""
+        from zope.interface import implementer
+
+        import transaction
+        import ZODB
+
+        db = ZODB.DB(source_mapping_storage)
+        conn = db.open()
+        conn.root()["key"] = "value"
+        transaction.commit()
+        conn.close()
+        db.close()
+
+        @implementer(IStorageRestoreable)
+        class BatchDest:
+            def __init__(self):
+                self.batches = []
+                self.restored = []
+
+            def restoreBatch(self, records, txn):
+                self.batches.append(list(records))
+
+            def restore(self, *args):
+                self.restored.append(args)
+
+            def tpc_begin(self, *args):
+                pass
+
+            def tpc_vote(self, txn):
+                pass
+
+            def tpc_finish(self, txn):
+                return None
+
+            def tpc_abort(self, txn):
+                pass
+
+        dest = BatchDest()
+        txn_count, obj_count, _blob_count = copy_transactions(
+            source_mapping_storage, dest
+        )
+        assert txn_count == 2  # initial root + our commit
+        assert obj_count >= 1
+        assert not dest.restored  # everything went through the batch API
+        assert sum(len(b) for b in dest.batches) == obj_count
+
+
+class _FakeTxn:
+    """Minimal transaction stand-in for prefetch tests."""
+
+    def __init__(self, tid, records=()):
+        self.tid = tid
+        self.status = " "
+        self._records = list(records)
+
+    def __iter__(self):
+        return iter(self._records)
+
+
+class TestPrefetch:
+    def test_yields_all_transactions_in_order(self, populated_source):
+        source_tids = [txn.tid for txn in populated_source.iterator()]
+        prefetched = list(_prefetch(populated_source.iterator()))
+        assert [txn.tid for txn in prefetched] == source_tids
+        # Records are materialized and iterable more than once
+        for txn in prefetched:
+            assert list(txn) == list(txn)
+
+    def test_propagates_producer_exception(self):
+        def failing_iter():
+            yield _FakeTxn(b"\0" * 8)
+            raise OSError("source read failed")
+
+        gen = _prefetch(failing_iter())
+        next(gen)
+        with pytest.raises(OSError, match="source read failed"):
+            next(gen)
+
+    def test_close_stops_producer_thread(self):
+        """Abandoning the generator early shuts the producer down."""
+
+        def endless_iter():
+            i = 0
+            while True:
+                i += 1
+                yield _FakeTxn(i.to_bytes(8, "big"))
+
+        gen = _prefetch(endless_iter(), maxsize=2)
+        next(gen)
+        # The producer is now blocked putting against the full queue.
+        gen.close()
+        for thread in threading.enumerate():
+            assert thread.name != "zodb-convert-prefetch"
+
+    def test_copy_without_prefetch(self, populated_source, dest_filestorage):
+        txn_count, obj_count, _blob_count = copy_transactions(
+            populated_source, dest_filestorage, prefetch=False
+        )
+        assert txn_count == 4
+        assert obj_count > 0
+
+
+class TestBatchedCommit:
+    def test_batched_copy_preserves_record_serials(
+        self, populated_source, dest_filestorage
+    ):
+        copy_transactions(populated_source, dest_filestorage, batch_size=10)
+
+        # All 4 source transactions collapse into a single destination commit
+        assert len(list(dest_filestorage.iterator())) == 1
+        # ...but the latest revision of every oid keeps its source serial.
+        # (Intermediate revisions within a batch become unreachable history,
+        # as after a pack.)
+        latest = {}
+        for txn in populated_source.iterator():
+            for record in txn:
+                if record.data:
+                    latest[record.oid] = record.tid
+        for oid, tid in latest.items():
+            assert dest_filestorage.loadSerial(oid, tid)
+            assert dest_filestorage.load(oid)[1] == tid
+
+        # And the data is readable
+        db = ZODB.DB(dest_filestorage)
+        conn = db.open()
+        root = conn.root()
+        assert root["key1"] == "value1"
+        assert root["key3"] == {"nested": [1, 2, 3]}
+        conn.close()
+        db.close()
+
+    def test_partial_final_batch_committed(self, populated_source, dest_filestorage):
+        # 4 source txns with batch_size=3: one full batch + one partial
+        txn_count, _obj_count, _blob_count = copy_transactions(
+            populated_source, dest_filestorage, batch_size=3
+        )
+        assert txn_count == 4
+        assert len(list(dest_filestorage.iterator())) == 2
+
+    def test_batching_ignored_for_store_fallback(
+        self, source_mapping_storage, dest_mapping_storage
+    ):
+        """Non-restoreable destinations commit per transaction regardless."""
+        db = ZODB.DB(source_mapping_storage)
+        conn = db.open()
+        conn.root()["key"] = "value"
+        transaction.commit()
+        conn.close()
+        db.close()
+
+        copy_transactions(source_mapping_storage, dest_mapping_storage, batch_size=10)
+        source_count = len(list(source_mapping_storage.iterator()))
+        assert len(list(dest_mapping_storage.iterator())) == source_count
 
 
 class TestCopyBlobs:
@@ -128,6 +419,33 @@ class TestCopyBlobs:
         conn.close()
         db.close()
 
+    def _find_blob_record(self, storage):
+        """Return (oid, tid, blob_path) of the last blob record in *storage*."""
+        found = None
+        for txn in storage.iterator():
+            for record in txn:
+                try:
+                    path = storage.loadBlob(record.oid, record.tid)
+                except Exception:
+                    continue
+                found = (record.oid, record.tid, path)
+        return found
+
+    def test_hardlink_blobs_shares_inode(self, populated_source, dest_filestorage):
+        copy_transactions(populated_source, dest_filestorage, hardlink_blobs=True)
+
+        oid, tid, src_path = self._find_blob_record(populated_source)
+        dst_path = dest_filestorage.loadBlob(oid, tid)
+        assert os.stat(dst_path).st_ino == os.stat(src_path).st_ino
+
+    def test_default_copies_blob_bytes(self, populated_source, dest_filestorage):
+        """Without hardlink_blobs, destination blobs get their own inodes."""
+        copy_transactions(populated_source, dest_filestorage)
+
+        oid, tid, src_path = self._find_blob_record(populated_source)
+        dst_path = dest_filestorage.loadBlob(oid, tid)
+        assert os.stat(dst_path).st_ino != os.stat(src_path).st_ino
+
     def test_copy_no_blobs_to_non_blob_dest(
         self, source_filestorage, dest_mapping_storage
     ):
@@ -203,6 +521,40 @@ class TestIncremental:
         last = dest_filestorage.lastTransaction()
         assert u64(tid) == u64(last) + 1
 
+    def test_sidecar_written_after_copy(self, populated_source, dest_filestorage):
+        copy_transactions(populated_source, dest_filestorage)
+
+        sidecar = _tid_sidecar_path(dest_filestorage.getName())
+        assert os.path.exists(sidecar)
+        assert _read_tid_sidecar(dest_filestorage.getName()) == (
+            dest_filestorage.lastTransaction()
+        )
+
+    def test_stale_sidecar_ignored(self, populated_source, dest_filestorage):
+        copy_transactions(populated_source, dest_filestorage)
+
+        # Make the data file newer than the sidecar: someone else wrote to it
+        sidecar = _tid_sidecar_path(dest_filestorage.getName())
+        newer = os.stat(dest_filestorage.getName()).st_mtime_ns + 10**9
+        os.utime(sidecar, ns=(newer - 2 * 10**9, newer - 2 * 10**9))
+        os.utime(dest_filestorage.getName(), ns=(newer, newer))
+
+        assert _read_tid_sidecar(dest_filestorage.getName()) is None
+        # Resume point discovery still works via the regular path
+        tid = get_incremental_start_tid(populated_source, dest_filestorage)
+        assert u64(tid) == u64(dest_filestorage.lastTransaction()) + 1
+
+    def test_filestorage_scan_back(self, populated_source, dest_filestorage):
+        copy_transactions(populated_source, dest_filestorage)
+        tids = [u64(txn.tid) for txn in dest_filestorage.iterator()]
+
+        # Exact bound hits that transaction
+        assert _filestorage_scan_back(dest_filestorage, tids[2]) == tids[2]
+        # A bound between transactions returns the last TID at or below it
+        assert _filestorage_scan_back(dest_filestorage, tids[2] + 1) == tids[2]
+        # Below the first transaction: nothing within the bound
+        assert _filestorage_scan_back(dest_filestorage, tids[0] - 1) is None
+
     def test_incremental_copy(self, temp_dir):
         """Copy some transactions, add more to source, copy again incrementally."""
         import os
@@ -313,6 +665,84 @@ class TestIncremental:
         dest.close()
 
 
+class TestRawCopyFileStorage:
+    def _make_source(self, temp_dir, keys, name="raw_src.fs"):
+        path = os.path.join(temp_dir, name)
+        storage = ZODB.FileStorage.FileStorage(path)
+        db = ZODB.DB(storage)
+        conn = db.open()
+        root = conn.root()
+        for key in keys:
+            root[key] = f"value-{key}"
+            transaction.commit()
+        conn.close()
+        db.close()
+        return path
+
+    def test_full_copy_is_byte_identical(self, temp_dir):
+        src_path = self._make_source(temp_dir, ["a", "b"])
+        dst_path = os.path.join(temp_dir, "raw_dst.fs")
+
+        txn_count, byte_count = raw_copy_filestorage(src_path, dst_path)
+
+        assert txn_count == 3  # root creation + two commits
+        assert byte_count == os.path.getsize(src_path) - 4
+        with open(src_path, "rb") as fsrc, open(dst_path, "rb") as fdst:
+            assert fsrc.read() == fdst.read()
+
+        dest = ZODB.FileStorage.FileStorage(dst_path)
+        db = ZODB.DB(dest)
+        conn = db.open()
+        assert conn.root()["a"] == "value-a"
+        assert conn.root()["b"] == "value-b"
+        conn.close()
+        db.close()
+
+    def test_incremental_append(self, temp_dir):
+        src_path = self._make_source(temp_dir, ["a"])
+        dst_path = os.path.join(temp_dir, "raw_dst.fs")
+        raw_copy_filestorage(src_path, dst_path)
+
+        # Grow the source by one transaction
+        storage = ZODB.FileStorage.FileStorage(src_path)
+        db = ZODB.DB(storage)
+        conn = db.open()
+        conn.root()["b"] = "value-b"
+        transaction.commit()
+        conn.close()
+        db.close()
+
+        dest = ZODB.FileStorage.FileStorage(dst_path)
+        start_tid = p64(u64(dest.lastTransaction()) + 1)
+        dest.close()
+
+        txn_count, _bytes = raw_copy_filestorage(src_path, dst_path, start_tid)
+        assert txn_count == 1
+
+        dest = ZODB.FileStorage.FileStorage(dst_path)
+        db = ZODB.DB(dest)
+        conn = db.open()
+        assert conn.root()["b"] == "value-b"
+        conn.close()
+        db.close()
+
+    def test_rejects_overlapping_splice(self, temp_dir):
+        src_path = self._make_source(temp_dir, ["a"])
+        dst_path = os.path.join(temp_dir, "raw_dst.fs")
+        raw_copy_filestorage(src_path, dst_path)
+
+        with pytest.raises(ValueError, match="splice point"):
+            raw_copy_filestorage(src_path, dst_path)
+
+    def test_rejects_non_filestorage_file(self, temp_dir):
+        bogus = os.path.join(temp_dir, "bogus.fs")
+        with open(bogus, "wb") as f:
+            f.write(b"not a filestorage")
+
+        with pytest.raises(ValueError, match="not a FileStorage"):
+            raw_copy_filestorage(bogus, os.path.join(temp_dir, "out.fs"))
+
+
 class TestParallelDelegation:
     """Test _try_parallel_delegation and workers path in copy_transactions."""
 
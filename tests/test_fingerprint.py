@@ -0,0 +1,105 @@
+from ZODB.interfaces import IStorageRestoreable
+from zodb_convert.copier import copy_transactions
+from zodb_convert.fingerprint import Fingerprints
+from zope.interface import implementer
+
+import os
+
+
+@implementer(IStorageRestoreable)
+class RecordingDest:
+    """Restore-capable fake that records every restored record."""
+
+    def __init__(self):
+        self.restored = []
+
+    def restore(self, oid, serial, data, version, prev_txn, txn):
+        self.restored.append(oid)
+
+    def tpc_begin(self, *args):
+        pass
+
+    def tpc_vote(self, txn):
+        pass
+
+    def tpc_finish(self, txn):
+        return None
+
+    def tpc_abort(self, txn):
+        pass
+
+
+class TestFingerprints:
+    def test_roundtrip(self, temp_dir):
+        fp = Fingerprints(os.path.join(temp_dir, "fp"))
+        digest = fp.digest(b"payload")
+        assert not fp.matches(b"oid00000", b"tid00000", digest)
+        fp.update(b"oid00000", b"tid00000", digest)
+        assert fp.matches(b"oid00000", b"tid00000", digest)
+        fp.close()
+
+    def test_revisions_tracked_separately(self, temp_dir):
+        """The same oid with a different tid is a different entry."""
+        fp = Fingerprints(os.path.join(temp_dir, "fp"))
+        digest = fp.digest(b"payload")
+        fp.update(b"oid00000", b"tid00001", digest)
+        assert fp.matches(b"oid00000", b"tid00001", digest)
+        assert not fp.matches(b"oid00000", b"tid00002", digest)
+        fp.close()
+
+    def test_persists_across_reopen(self, temp_dir):
+        path = os.path.join(temp_dir, "fp")
+        fp = Fingerprints(path)
+        digest = fp.digest(b"data")
+        fp.update(b"oid00000", b"tid00000", digest)
+        fp.close()
+
+        fp2 = Fingerprints(path)
+        assert fp2.matches(b"oid00000", b"tid00000", digest)
+        fp2.close()
+
+    def test_len_and_clear(self, temp_dir):
+        fp = Fingerprints(os.path.join(temp_dir, "fp"))
+        assert len(fp) == 0
+        fp.update(b"oid00000", b"tid00000", fp.digest(b"data"))
+        fp.update(b"oid00001", b"tid00000", fp.digest(b"data"))
+        assert len(fp) == 2
+        fp.clear()
+        assert len(fp) == 0
+        fp.close()
+
+
+class TestCheckpointCopy:
+    def test_second_run_skips_already_copied_records(self, populated_source, temp_dir):
+        fp = Fingerprints(os.path.join(temp_dir, "fp"))
+        try:
+            dest = RecordingDest()
+            _txns, obj_count, _blobs = copy_transactions(
+                populated_source, dest, fingerprints=fp
+            )
+            assert len(dest.restored) == obj_count
+
+            # Re-run against the same destination: every record matches a
+            # fingerprint and nothing is restored again.
+            _txns, obj_count2, _blobs = copy_transactions(
+                populated_source, dest, fingerprints=fp
+            )
+            assert obj_count2 == obj_count
+            assert len(dest.restored) == obj_count
+        finally:
+            fp.close()
+
+    def test_rerun_same_destination_adds_no_transactions(
+        self, populated_source, dest_filestorage, temp_dir
+    ):
+        """Fully-skipped transactions must not commit empty duplicates."""
+        fp = Fingerprints(os.path.join(temp_dir, "fp"))
+        try:
+            copy_transactions(populated_source, dest_filestorage, fingerprints=fp)
+            before = [txn.tid for txn in dest_filestorage.iterator()]
+
+            copy_transactions(populated_source, dest_filestorage, fingerprints=fp)
+            after = [txn.tid for txn in dest_filestorage.iterator()]
+            assert after == before
+        finally:
+            fp.close()
@@ -0,0 +1,106 @@
+from types import SimpleNamespace
+from zodb_convert.config import open_storages
+from zodb_convert.pool import StoragePool
+
+import os
+
+
+class FakeStorage:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class TestStoragePool:
+    def test_acquire_opens_once_per_key(self):
+        pool = StoragePool()
+        opened = []
+
+        def factory():
+            opened.append(FakeStorage())
+            return opened[-1]
+
+        first = pool.acquire("key", factory)
+        second = pool.acquire("key", factory)
+        assert len(opened) == 1
+        assert first._obj is second._obj
+
+    def test_close_releases_without_closing(self):
+        pool = StoragePool()
+        storage = FakeStorage()
+        handle = pool.acquire("key", lambda: storage)
+        handle.close()
+        assert storage.closed is False
+        # The entry stays pooled and is reused
+        assert pool.acquire("key", FakeStorage)._obj is storage
+
+    def test_eviction_closes_oldest_unreferenced(self):
+        pool = StoragePool(max_size=1)
+        first = FakeStorage()
+        second = FakeStorage()
+        pool.acquire("a", lambda: first).close()
+        pool.acquire("b", lambda: second)
+        assert first.closed is True
+        assert second.closed is False
+
+    def test_referenced_entries_survive_eviction(self):
+        pool = StoragePool(max_size=1)
+        first = FakeStorage()
+        pool.acquire("a", lambda: first)  # handle kept open
+        pool.acquire("b", FakeStorage)
+        assert first.closed is False
+
+    def test_pool_close_closes_everything(self):
+        pool = StoragePool()
+        storage = FakeStorage()
+        pool.acquire("key", lambda: storage)
+        pool.close()
+        assert storage.closed is True
+
+    def test_attribute_proxying(self):
+        pool = StoragePool()
+        storage = FakeStorage()
+        storage.getName = lambda: "pooled.fs"
+        handle = pool.acquire("key", lambda: storage)
+        assert handle.getName() == "pooled.fs"
+
+
+class TestOpenStoragesWithPool:
+    def _make_zope_conf(self, temp_dir, name):
+        fs_path = os.path.join(temp_dir, f"{name}.fs")
+        zope_conf = f"""\
+<zodb_db main>
+    <filestorage>
+        path {fs_path}
+    </filestorage>
+</zodb_db>
+"""
+        conf_path = os.path.join(temp_dir, f"{name}_zope.conf")
+        with open(conf_path, "w") as f:
+            f.write(zope_conf)
+        return conf_path
+
+    def test_pool_reuses_zope_conf_storage(self, temp_dir):
+        src_conf = self._make_zope_conf(temp_dir, "source")
+        dest_conf = self._make_zope_conf(temp_dir, "dest")
+        options = SimpleNamespace(
+            config_file=None,
+            source_zope_conf=src_conf,
+            source_db="main",
+            dest_zope_conf=dest_conf,
+            dest_db="main",
+        )
+        pool = StoragePool()
+        try:
+            source1, _dest1, closables1 = open_storages(options, pool=pool)
+            for c in closables1:
+                c.close()
+            # Second open of the same configs hits the pool
+            source2, _dest2, closables2 = open_storages(options, pool=pool)
+            assert source1 is source2
+            for c in closables2:
+                c.close()
+        finally:
+            pool.close()
@@ -19,6 +19,9 @@ class TestFormatHelpers:
     def test_format_bytes_gb(self):
         assert _format_bytes(2 * 1024 * 1024 * 1024) == "2.0 GB"
 
+    def test_format_bytes_tb(self):
+        assert _format_bytes(3 * 1024**4) == "3.0 TB"
+
     def test_format_duration_seconds(self):
         assert _format_duration(30.5) == "30.5s"
 
@@ -101,6 +104,81 @@ class TestProgressReporter:
         # First transaction always logged
         assert len(caplog.records) >= 1
 
+    def test_check_mask_scales_with_total(self):
+        """Large conversions sample the clock less often."""
+        p = ProgressReporter(total_oids=10_000_000)
+        assert p._check_mask == 1023  # stride ~1000, rounded to a mask
+
+    def test_check_mask_default_for_small_totals(self):
+        p = ProgressReporter(total_oids=1000)
+        assert p._check_mask == ProgressReporter.CHECK_MASK
+
+    def test_on_transactions_sums_counters(self):
+        p = ProgressReporter(total_oids=10)
+        batch = [(p64(i + 1), 2, 100, 1, [p64(i + 1)]) for i in range(5)]
+        p.on_transactions(batch)
+        assert p.txn_count == 5
+        assert p.obj_count == 10
+        assert p.blob_count == 5
+        assert p.total_bytes == 500
+        assert len(p._seen_oids) == 5
+
+    def test_on_transactions_logs_once_per_batch(self, caplog):
+        p = ProgressReporter(total_oids=10, verbose=True)
+        batch = [(p64(i + 1), 1, 100, 0, ()) for i in range(5)]
+        with caplog.at_level(logging.INFO, logger="zodb-convert"):
+            p.on_transactions(batch)
+        assert len(caplog.records) == 1
+
+    def test_on_transactions_empty_batch(self):
+        p = ProgressReporter()
+        p.on_transactions([])
+        assert p.txn_count == 0
+
+    def test_lazy_log_argument_defers_formatting(self):
+        from zodb_convert.progress import _format_bytes
+        from zodb_convert.progress import _Lazy
+
+        calls = []
+
+        def fn(n):
+            calls.append(n)
+            return _format_bytes(n)
+
+        lazy = _Lazy(fn, 2048)
+        assert calls == []  # nothing ran at construction
+        assert str(lazy) == "2.0 KB"
+        assert calls == [2048]
+
+    def test_factory_selects_mode_subclass(self):
+        """ProgressReporter() hands back the mode-specialized class."""
+        from zodb_convert.progress import _IntervalReporter
+        from zodb_convert.progress import _VerboseReporter
+
+        assert type(ProgressReporter(verbose=True)) is _VerboseReporter
+        assert type(ProgressReporter()) is _IntervalReporter
+
+    def test_next_check_scheduling(self):
+        """The clock-sample point advances past each check."""
+        p = ProgressReporter(log_interval=10_000, log_count=100)
+        first_check = p._next_check_txn
+        for i in range(first_check):
+            p.on_transaction(p64(i + 1), record_count=1, byte_size=10, blob_count=0)
+        assert p._next_check_txn > first_check
+
+    def test_disabled_info_skips_format_work(self, monkeypatch, caplog):
+        """No _pct/_eta/_format_bytes work when INFO is filtered out."""
+        p = ProgressReporter(total_oids=10, verbose=True)
+
+        def boom():
+            raise AssertionError("formatting ran with INFO disabled")
+
+        # Patched on the class: __slots__ leaves no instance __dict__.
+        monkeypatch.setattr(ProgressReporter, "_pct", lambda self: boom())
+        with caplog.at_level(logging.WARNING, logger="zodb-convert"):
+            p.on_transaction(p64(1), record_count=1, byte_size=100, blob_count=0)
+        assert p.txn_count == 1
+
     def test_oid_tracking_for_progress(self):
         """OIDs passed via on_transaction are tracked for progress %."""
         p = ProgressReporter(total_oids=10)
@@ -112,6 +190,45 @@ class TestProgressReporter:
         assert len(p._seen_oids) == 2
         assert p._pct() == 20.0  # 2/10
 
+    def test_lazy_total_oids_resolved_on_first_log(self, caplog):
+        """A callable total_oids is not invoked until progress is logged."""
+        calls = []
+
+        def total():
+            calls.append(1)
+            return 10
+
+        p = ProgressReporter(total_oids=total, verbose=True)
+        assert calls == []
+        with caplog.at_level(logging.INFO, logger="zodb-convert"):
+            p.on_transaction(
+                p64(1), record_count=1, byte_size=100, blob_count=0, oids=[p64(1)]
+            )
+        assert calls == [1]
+        assert p._pct() == 10.0
+
+    def test_lazy_total_oids_failure_falls_back(self):
+        """A failing total_oids callable degrades to no percentage."""
+
+        def total():
+            raise RuntimeError("no len")
+
+        p = ProgressReporter(total_oids=total)
+        assert p._pct() == 0
+        assert p.total_oids == 0
+
+    def test_pct_bytes_fallback(self):
+        """Without total_oids, percentage falls back to bytes copied."""
+        p = ProgressReporter(total_source_bytes=1000)
+        p.on_transaction(p64(1), record_count=1, byte_size=250, blob_count=0)
+        assert p._pct() == 25.0
+
+    def test_pct_bytes_fallback_capped(self):
+        """Byte-based percentage never exceeds 100%."""
+        p = ProgressReporter(total_source_bytes=100)
+        p.on_transaction(p64(1), record_count=1, byte_size=500, blob_count=0)
+        assert p._pct() == 100.0
+
     def test_oid_dedup(self):
         """Same OID in multiple transactions is counted once."""
         p = ProgressReporter(total_oids=10)